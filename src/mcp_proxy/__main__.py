@@ -13,11 +13,11 @@ import os
 import sys
 import typing as t
 
-from mcp.client.stdio import StdioServerParameters
+if t.TYPE_CHECKING:
+    import uvicorn
+    from mcp.server import Server
 
-from .sse_client import run_sse_client
-from .sse_server import SseServerSettings, run_sse_server
-from .server_manager import server_manager
+    from .sse_server import SseServerSettings
 
 logging.basicConfig(level=logging.DEBUG)
 SSE_URL: t.Final[str | None] = os.getenv(
@@ -26,8 +26,35 @@ SSE_URL: t.Final[str | None] = os.getenv(
 )
 
 
-def main() -> None:
-    """Start the client using asyncio."""
+def _wants_server_list(argv: list[str]) -> bool:
+    """Check for --list-servers without building the full argument parser.
+
+    Arguments after ``--`` belong to the spawned command and are ignored.
+    """
+    for arg in argv:
+        if arg == "--":
+            return False
+        if arg == "--list-servers":
+            return True
+    return False
+
+
+def _print_servers() -> None:
+    """Print the available local MCP servers."""
+    # Only the registry metadata is needed, not the client transports behind server_manager
+    from mcp_servers import MCPServerRegistry
+
+    available_servers = MCPServerRegistry.list_servers_sorted()
+    if available_servers:
+        print("Available local MCP servers:")
+        for server_info in available_servers:
+            print(f"  - {server_info.name}: {server_info.description or 'No description'}")
+    else:
+        print("No local MCP servers available.")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description=(
             "Start the MCP proxy in one of two possible modes: as an SSE or stdio client."
@@ -120,25 +147,29 @@ def main() -> None:
         default=[],
         help="Allowed origins for the SSE server. Can be used multiple times. Default is no CORS allowed.",  # noqa: E501
     )
+    return parser
+
 
+def main() -> None:
+    """Start the client using asyncio."""
+    # Fast path: listing servers needs neither the full parser nor the transport modules
+    if _wants_server_list(sys.argv[1:]):
+        _print_servers()
+        sys.exit(0)
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Handle --list-servers flag
     if args.list_servers:
-        available_servers = server_manager.list_available_servers()
-        if available_servers:
-            print("Available local MCP servers:")
-            for server_name in available_servers:
-                server_info = server_manager.get_server_info(server_name)
-                description = server_info.get("description", "No description") if server_info else ""
-                print(f"  - {server_name}: {description}")
-        else:
-            print("No local MCP servers available.")
+        _print_servers()
         sys.exit(0)
 
     # Handle local server
     if args.local_server:
-        logging.debug(f"Starting local server: {args.local_server}")
+        from .sse_server import SseServerSettings
+
+        logging.debug("Starting local server: %s", args.local_server)
         sse_settings = SseServerSettings(
             bind_host=args.sse_host,
             port=args.sse_port,
@@ -157,6 +188,8 @@ def main() -> None:
         or args.command_or_url.startswith("https://")
     ):
         # Start a client connected to the SSE server, and expose as a stdio server
+        from .sse_client import run_sse_client
+
         logging.debug("Starting SSE client and stdio server")
         headers = dict(args.headers)
         if api_access_token := os.getenv("API_ACCESS_TOKEN", None):
@@ -165,6 +198,10 @@ def main() -> None:
         return
 
     # Start a client connected to the given command, and expose as an SSE server
+    from mcp.client.stdio import StdioServerParameters
+
+    from .sse_server import SseServerSettings, run_sse_server
+
     logging.debug("Starting stdio client and SSE server")
 
     # The environment variables passed to the server process
@@ -173,7 +210,7 @@ def main() -> None:
     if args.pass_environment:
         env.update(os.environ)
     # Pass in and override any environment variables with those passed on the command line
-    env.update(dict(args.env))
+    env.update(args.env)
 
     stdio_params = StdioServerParameters(
         command=args.command_or_url,
@@ -188,21 +225,22 @@ def main() -> None:
     asyncio.run(run_sse_server(stdio_params, sse_settings))
 
 
-async def run_local_server(server_name: str, sse_settings: SseServerSettings) -> None:
-    """Run a local MCP server.
-    
+def _build_http_server(
+    mcp_server: "Server",
+    sse_settings: "SseServerSettings",
+) -> "uvicorn.Server":
+    """Build the HTTP server exposing an MCP server over SSE, without doing any IO.
+
     Args:
-        server_name: Name of the local server to run
+        mcp_server: The MCP server to expose
         sse_settings: Settings for the SSE server
+
+    Returns:
+        A configured HTTP server, ready to serve
     """
-    from .sse_server import create_starlette_app
     import uvicorn
 
-    # Create the local server
-    mcp_server = await server_manager.create_local_server(server_name)
-    if not mcp_server:
-        logging.error(f"Failed to create local server: {server_name}")
-        sys.exit(1)
+    from .sse_server import create_starlette_app
 
     # Create Starlette app for SSE server
     starlette_app = create_starlette_app(
@@ -218,9 +256,31 @@ async def run_local_server(server_name: str, sse_settings: SseServerSettings) ->
         port=sse_settings.port,
         log_level=sse_settings.log_level.lower(),
     )
-    http_server = uvicorn.Server(config)
+    return uvicorn.Server(config)
+
+
+async def run_local_server(server_name: str, sse_settings: "SseServerSettings") -> None:
+    """Run a local MCP server.
     
-    logging.info(f"Local MCP server '{server_name}' running at http://{sse_settings.bind_host}:{sse_settings.port}/sse")
+    Args:
+        server_name: Name of the local server to run
+        sse_settings: Settings for the SSE server
+    """
+    from .server_manager import server_manager
+
+    # Create the local server
+    mcp_server = await server_manager.create_local_server(server_name)
+    if not mcp_server:
+        logging.error("Failed to create local server: %s", server_name)
+        sys.exit(1)
+
+    http_server = _build_http_server(mcp_server, sse_settings)
+    logging.info(
+        "Local MCP server '%s' running at http://%s:%s/sse",
+        server_name,
+        sse_settings.bind_host,
+        sse_settings.port,
+    )
     await http_server.serve()
 
 
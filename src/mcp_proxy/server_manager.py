@@ -5,24 +5,106 @@ This module provides functionality to manage and route to different MCP servers.
 
 import typing as t
 import logging
-import os
 import asyncio
-from pathlib import Path
+import functools
+import sys
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
 
+import httpx
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 from mcp.client.sse import sse_client
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
-# Import the MCP server registry directly from mcp_servers
-# Make sure src directory is in sys.path (handled in __init__.py)
+# mcp_servers is installed alongside mcp_proxy (see tool.setuptools.packages.find)
+import mcp_servers
 from mcp_servers import MCPServerRegistry
 
 from .proxy_server import create_proxy_server
 
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup
+
 logger = logging.getLogger(__name__)
 
+# Identifies a stdio server process: command, arguments and sorted environment
+StdioKey = tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]]
+
+
+# Errors that mean a server could not be reached or started, as opposed to bugs
+CONNECTION_ERRORS = (OSError, asyncio.TimeoutError, httpx.HTTPError)
+
+
+@dataclass(eq=False)
+class _Connection:
+    """A client session and the task that owns its lifetime."""
+    
+    session: ClientSession
+    task: asyncio.Task[None]
+    closing: asyncio.Event
+
+
+async def _run_connection(
+    transport: AbstractAsyncContextManager[t.Any],
+    ready: asyncio.Future[ClientSession],
+    closing: asyncio.Event,
+) -> None:
+    """Keep a transport and its client session open until closing is set.
+    
+    The transport contexts are entered and exited in this one task, as anyio
+    requires, so the session can be shared with any number of callers.
+    """
+    async with transport as streams, ClientSession(*streams) as session:
+        ready.set_result(session)
+        await closing.wait()
+
+
+async def _open_connection(transport: AbstractAsyncContextManager[t.Any]) -> _Connection:
+    """Open a client session over a transport, owned by a background task.
+    
+    Raises:
+        The error the transport failed with, unwrapped from single-error exception groups
+    """
+    ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+    closing = asyncio.Event()
+    task = asyncio.create_task(_run_connection(transport, ready, closing))
+    waiters: set[asyncio.Future[t.Any]] = {ready, task}
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        # Nobody would own the connection, so don't leave the server running
+        task.cancel()
+        raise
+    if not ready.done():
+        error = task.exception()
+        assert error is not None  # noqa: S101
+        raise _unwrap(error)
+    return _Connection(session=ready.result(), task=task, closing=closing)
+
+
+def _unwrap(error: BaseException) -> BaseException:
+    """Unwrap single-error exception groups, as anyio task groups wrap errors."""
+    while isinstance(error, BaseExceptionGroup) and len(error.exceptions) == 1:
+        error = error.exceptions[0]
+    return error
+
+
+def _log_connection_exit(kind: str, target: str, task: asyncio.Task[None]) -> None:
+    """Retrieve and log the error a connection's owner task exited with, if any."""
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.error(
+            "Connection to %s server %s closed with an error: %s", kind, target, _unwrap(error),
+        )
+
+
+async def _close_connection(connection: _Connection) -> None:
+    """Ask a connection's owner task to close the session and wait for it to exit."""
+    connection.closing.set()
+    await asyncio.wait({connection.task})
+
 
 class ServerManager:
     """Manager for MCP servers.
@@ -34,33 +116,34 @@ class ServerManager:
     def __init__(self) -> None:
         """Initialize the server manager."""
         self._active_servers: dict[str, Server] = {}
+        self._stdio_pool: dict[StdioKey, _Connection] = {}
+        # Per-signature spawn locks, dropped once no caller holds or awaits them
+        self._stdio_locks: dict[StdioKey, asyncio.Lock] = {}
+        self._stdio_lock_users: dict[StdioKey, int] = {}
+        self._remote_connections: set[_Connection] = set()
+        # Bind the registry lookups once instead of resolving the classmethods per call
+        self._registry_get = MCPServerRegistry.get_server
+        self._registry_names = MCPServerRegistry.list_server_names
+        self._registry_describe = MCPServerRegistry.describe_server
     
-    def list_available_servers(self) -> list[str]:
+    def list_available_servers(self) -> tuple[str, ...]:
         """List all available servers.
         
         Returns:
-            List of server names
+            Server names
         """
-        return [server.name for server in MCPServerRegistry.list_servers()]
+        return self._registry_names()
     
-    def get_server_info(self, name: str) -> t.Optional[dict[str, t.Any]]:
+    def get_server_info(self, name: str) -> t.Optional[t.Mapping[str, t.Any]]:
         """Get information about a server.
         
         Args:
             name: Name of the server
             
         Returns:
-            Dictionary with server information
+            Read-only mapping with server information
         """
-        server_info = MCPServerRegistry.get_server(name)
-        if not server_info:
-            return None
-        
-        return {
-            "name": server_info.name,
-            "description": server_info.description,
-            "server_type": server_info.server_type.name,
-        }
+        return self._registry_describe(name)
     
     async def create_local_server(self, name: str) -> t.Optional[Server]:
         """Create a local MCP server.
@@ -71,19 +154,16 @@ class ServerManager:
         Returns:
             The created server or None if not found
         """
-        server_info = MCPServerRegistry.get_server(name)
+        server_info = self._registry_get(name)
         if not server_info:
-            logger.error(f"Server '{name}' not found")
+            logger.error("Server '%s' not found", name)
             return None
         
-        logger.info(f"Creating local server: {name}")
+        logger.info("Creating local server: %s", name)
         
-        # Import the server instance directly from mcp_servers
         try:
-            # Import the module containing the server instance
-            import mcp_servers
-            
-            # Get the server instance dynamically (e.g., slack_server, googlesheets_server)
+            # Get the server instance dynamically (e.g., slack_server). Backends are imported
+            # and instantiated on first access, see mcp_servers/__init__.py
             server_instance = getattr(mcp_servers, f"{name}_server")
             await server_instance.initialize()
             server = await server_instance.create_server()
@@ -93,7 +173,7 @@ class ServerManager:
             
             return server
         except (ImportError, AttributeError) as e:
-            logger.error(f"Failed to create server '{name}': {e}")
+            logger.error("Failed to create server '%s': %s", name, e)
             return None
     
     async def create_remote_server_connection(
@@ -109,18 +189,24 @@ class ServerManager:
             A client session for the remote server
         """
         try:
-            streams = await sse_client(url=url, headers=headers)
-            session = ClientSession(*streams)
-            return session
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Failed to connect to remote server at {url}: {e}")
+            connection = await _open_connection(sse_client(url=url, headers=headers))
+        except CONNECTION_ERRORS as e:
+            logger.error("Failed to connect to remote server at %s: %s", url, e)
             return None
+        self._remote_connections.add(connection)
+        connection.task.add_done_callback(
+            functools.partial(self._forget_remote_connection, url, connection),
+        )
+        return connection.session
     
     async def create_stdio_server_connection(
         self, command: str, args: list[str] = None, env: dict[str, str] = None
     ) -> t.Optional[ClientSession]:
         """Create a connection to a stdio MCP server.
         
+        Connections are pooled by command, arguments and environment, so repeated
+        calls with the same parameters reuse the running server process.
+        
         Args:
             command: Command to run
             args: Optional arguments for the command
@@ -129,18 +215,67 @@ class ServerManager:
         Returns:
             A client session for the stdio server
         """
-        try:
-            params = StdioServerParameters(
-                command=command,
-                args=args or [],
-                env=env or {},
+        args = args or []
+        env = env or {}
+        key: StdioKey = (command, tuple(args), tuple(sorted(env.items())))
+        
+        # One lock per signature so concurrent callers don't spawn the same server twice
+        async with self._stdio_lock(key):
+            connection = self._stdio_pool.get(key)
+            if connection and not connection.task.done():
+                return connection.session
+            
+            params = StdioServerParameters(command=command, args=args, env=env)
+            try:
+                connection = await _open_connection(stdio_client(params))
+            except CONNECTION_ERRORS as e:
+                logger.error("Failed to connect to stdio server '%s': %s", command, e)
+                return None
+            
+            self._stdio_pool[key] = connection
+            connection.task.add_done_callback(
+                functools.partial(self._forget_stdio_connection, key, connection),
             )
-            streams = await stdio_client(params)
-            session = ClientSession(*streams)
-            return session
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Failed to connect to stdio server '{command}': {e}")
-            return None
+            return connection.session
+    
+    @asynccontextmanager
+    async def _stdio_lock(self, key: StdioKey) -> AsyncIterator[None]:
+        """Hold the spawn lock of a stdio server signature."""
+        lock = self._stdio_locks.setdefault(key, asyncio.Lock())
+        self._stdio_lock_users[key] = self._stdio_lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._stdio_lock_users[key] -= 1
+            if not self._stdio_lock_users[key]:
+                del self._stdio_lock_users[key]
+                del self._stdio_locks[key]
+    
+    def _forget_stdio_connection(
+        self, key: StdioKey, connection: _Connection, task: asyncio.Task[None],
+    ) -> None:
+        """Drop a pooled stdio connection once its owner task has exited."""
+        if self._stdio_pool.get(key) is connection:
+            del self._stdio_pool[key]
+        _log_connection_exit("stdio", key[0], task)
+    
+    def _forget_remote_connection(
+        self, url: str, connection: _Connection, task: asyncio.Task[None],
+    ) -> None:
+        """Drop a remote connection once its owner task has exited."""
+        self._remote_connections.discard(connection)
+        _log_connection_exit("remote", url, task)
+    
+    async def close_all(self) -> None:
+        """Close all pooled stdio and remote server connections."""
+        # Take each signature's lock so spawns in flight finish first and get closed too
+        for key in {*self._stdio_pool, *self._stdio_locks}:
+            async with self._stdio_lock(key):
+                if connection := self._stdio_pool.pop(key, None):
+                    await _close_connection(connection)
+        
+        await asyncio.gather(*map(_close_connection, list(self._remote_connections)))
     
     async def create_proxy_server(self, remote_app: ClientSession) -> Server:
         """Create a proxy server that forwards requests to a remote server.
@@ -1,10 +1,41 @@
 """MCP Servers package.
 
 This package provides various MCP server implementations.
+
+Server backends are imported lazily on first attribute access so that processes
+which only need the registry (e.g. ``--list-servers``) do not pay for loading them.
+Each backend keeps its registry metadata in a separate ``*_info`` module.
 """
 
+import importlib
+import typing as t
+
 from .base import BaseMCPServer, MCPServerRegistry, ServerInfo, ServerType
-from .slack import slack_server
+from .slack_info import SLACK_SERVER_INFO
+
+# Maps lazily exported attributes to the submodule that defines them
+_LAZY: dict[str, str] = {
+    "slack_server": ".slack",
+}
+
+# Register metadata for the bundled servers without importing their implementations
+MCPServerRegistry.register(SLACK_SERVER_INFO)
+
+
+def __getattr__(name: str) -> t.Any:  # noqa: ANN401
+    """Import a server backend on first access and cache it in the module namespace."""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including the lazily imported ones."""
+    return sorted({*globals(), *_LAZY})
+
 
 __all__ = [
     "BaseMCPServer",
@@ -12,4 +43,4 @@ __all__ = [
     "ServerInfo",
     "ServerType",
     "slack_server",
-] 
\ No newline at end of file
+]
@@ -28,10 +28,10 @@ async def run_server(server_name: str) -> int:
     # Get server info from registry
     server_info = MCPServerRegistry.get_server(server_name)
     if not server_info:
-        logger.error(f"Server '{server_name}' not found")
+        logger.error("Server '%s' not found", server_name)
         return 1
     
-    logger.info(f"Starting server: {server_name}")
+    logger.info("Starting server: %s", server_name)
     
     try:
         # Import the module
@@ -42,7 +42,7 @@ async def run_server(server_name: str) -> int:
         await server_instance.initialize()
         server = await server_instance.create_server()
         
-        logger.info(f"Server '{server_name}' initialized")
+        logger.info("Server '%s' initialized", server_name)
         
         # Run the server with stdio transport
         async with stdio_server() as (read_stream, write_stream):
@@ -54,7 +54,7 @@ async def run_server(server_name: str) -> int:
         
         return 0
     except (ImportError, AttributeError) as e:
-        logger.error(f"Failed to create server '{server_name}': {e}")
+        logger.error("Failed to create server '%s': %s", server_name, e)
         return 1
 
 
@@ -64,7 +64,7 @@ def main() -> int:
     parser.add_argument(
         "server_name",
         help="Name of the server to run",
-        choices=[server.name for server in MCPServerRegistry.list_servers()],
+        choices=[server.name for server in MCPServerRegistry.list_servers_sorted()],
     )
     parser.add_argument(
         "--list",
@@ -77,7 +77,7 @@ def main() -> int:
     # Handle --list flag
     if args.list:
         print("Available MCP servers:")
-        for server in MCPServerRegistry.list_servers():
+        for server in MCPServerRegistry.list_servers_sorted():
             print(f"  - {server.name}: {server.description}")
         return 0
     
@@ -6,8 +6,9 @@ a registry to manage available servers.
 
 import abc
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
+from types import MappingProxyType
 
 from mcp import server, types
 
@@ -19,7 +20,7 @@ class ServerType(Enum):
     SSE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerInfo:
     """Information about a registered server."""
     
@@ -27,10 +28,10 @@ class ServerInfo:
     description: str
     server_type: ServerType
     command: str
-    args: list[str] = None
-    env: dict[str, str] = None
+    args: t.Optional[list[str]] = field(default_factory=list)
+    env: t.Optional[dict[str, str]] = field(default_factory=dict)
     
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Initialize default values for args and env."""
         if self.args is None:
             self.args = []
@@ -42,6 +43,11 @@ class MCPServerRegistry:
     """Registry of available MCP servers."""
     
     _servers: dict[str, ServerInfo] = {}
+    # Derived views, rebuilt lazily after each registration
+    _servers_cache: t.Optional[tuple[ServerInfo, ...]] = None
+    _names_cache: t.Optional[tuple[str, ...]] = None
+    _sorted_cache: t.Optional[tuple[ServerInfo, ...]] = None
+    _info_cache: dict[str, t.Mapping[str, t.Any]] = {}
     
     @classmethod
     def register(cls, server_info: ServerInfo) -> None:
@@ -51,6 +57,10 @@ class MCPServerRegistry:
             server_info: Information about the server to register
         """
         cls._servers[server_info.name] = server_info
+        cls._servers_cache = None
+        cls._names_cache = None
+        cls._sorted_cache = None
+        cls._info_cache.pop(server_info.name, None)
     
     @classmethod
     def get_server(cls, name: str) -> t.Optional[ServerInfo]:
@@ -65,13 +75,59 @@ class MCPServerRegistry:
         return cls._servers.get(name)
     
     @classmethod
-    def list_servers(cls) -> list[ServerInfo]:
+    def list_servers(cls) -> tuple[ServerInfo, ...]:
         """List all registered servers.
         
         Returns:
-            List of all registered servers
+            All registered servers, in registration order
         """
-        return list(cls._servers.values())
+        if cls._servers_cache is None:
+            cls._servers_cache = tuple(cls._servers.values())
+        return cls._servers_cache
+    
+    @classmethod
+    def list_servers_sorted(cls) -> tuple[ServerInfo, ...]:
+        """List all registered servers sorted by name, for deterministic output.
+        
+        Returns:
+            All registered servers, sorted by name
+        """
+        if cls._sorted_cache is None:
+            cls._sorted_cache = tuple(sorted(cls._servers.values(), key=lambda s: s.name))
+        return cls._sorted_cache
+    
+    @classmethod
+    def list_server_names(cls) -> tuple[str, ...]:
+        """List the names of all registered servers.
+        
+        Returns:
+            Names of all registered servers, in registration order
+        """
+        if cls._names_cache is None:
+            cls._names_cache = tuple(cls._servers)
+        return cls._names_cache
+    
+    @classmethod
+    def describe_server(cls, name: str) -> t.Optional[t.Mapping[str, t.Any]]:
+        """Get a read-only summary of a server.
+        
+        Args:
+            name: Name of the server to describe
+            
+        Returns:
+            Mapping with the server name, description and type if found, None otherwise
+        """
+        info = cls._info_cache.get(name)
+        if info is None:
+            server_info = cls._servers.get(name)
+            if not server_info:
+                return None
+            info = cls._info_cache[name] = MappingProxyType({
+                "name": server_info.name,
+                "description": server_info.description,
+                "server_type": server_info.server_type.name,
+            })
+        return info
 
 
 class BaseMCPServer(abc.ABC):
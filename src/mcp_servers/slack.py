@@ -9,10 +9,11 @@ from dataclasses import dataclass, field
 
 from mcp import server, types
 
-from .base import BaseMCPServer, MCPServerRegistry, ServerInfo, ServerType
+from .base import BaseMCPServer, ServerInfo
+from .slack_info import SLACK_SERVER_INFO
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SlackTool:
     """Representation of a Slack tool."""
     
@@ -20,19 +21,32 @@ class SlackTool:
     description: str
     parameters: dict[str, t.Any]
     required_parameters: list[str] = field(default_factory=list)
+    required_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the required parameters as a set for fast validation."""
+        object.__setattr__(self, "required_set", frozenset(self.required_parameters))
 
 
-class SlackMCPServer(BaseMCPServer):
-    """Slack MCP server implementation."""
+def _error_result(text: str) -> types.ServerResult:
+    """Build a tool error result.
     
-    _server_info = ServerInfo(
-        name="slack",
-        description="Slack MCP server for interacting with Slack API",
-        server_type=ServerType.STDIO,
-        command="slack_mcp",
-        args=[],
-        env={},
+    Args:
+        text: The error message
+        
+    Returns:
+        A call tool result flagged as an error
+    """
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(type="text", text=text)],
+            isError=True,
+        ),
     )
+
+
+class SlackMCPServer(BaseMCPServer):
+    """Slack MCP server implementation."""
     
     def __init__(self) -> None:
         """Initialize the Slack MCP server."""
@@ -59,9 +73,26 @@ class SlackMCPServer(BaseMCPServer):
                 required_parameters=[],
             ),
         ]
-        
-        # Register the server with the registry
-        MCPServerRegistry.register(self._server_info)
+        self._tool_index: dict[str, SlackTool] = {tool.name: tool for tool in self._tools}
+        # The tool set is static, so the list tools response is built once and shared
+        self._list_tools_result = types.ServerResult(types.ListToolsResult(tools=[
+            types.Tool(
+                name=tool.name,
+                description=tool.description,
+                inputSchema={
+                    "type": "object",
+                    "properties": tool.parameters,
+                    "required": tool.required_parameters,
+                },
+            )
+            for tool in self._tools
+        ]))
+        # Likewise for the missing parameter errors, which only name declared parameters
+        self._missing_parameter_results = {
+            param: _error_result(f"Missing required parameter: {param}")
+            for tool in self._tools
+            for param in tool.required_parameters
+        }
     
     async def initialize(self) -> None:
         """Initialize the server."""
@@ -79,14 +110,7 @@ class SlackMCPServer(BaseMCPServer):
         # Register tool handlers
         async def _list_tools(_: t.Any) -> types.ServerResult:  # noqa: ANN401
             """Handle list tools request."""
-            tools = []
-            for tool in self._tools:
-                tools.append(types.Tool(
-                    name=tool.name,
-                    description=tool.description,
-                    parameters=tool.parameters,
-                ))
-            return types.ServerResult(types.ListToolsResult(tools=tools))
+            return self._list_tools_result
         
         app.request_handlers[types.ListToolsRequest] = _list_tools
         
@@ -96,27 +120,14 @@ class SlackMCPServer(BaseMCPServer):
             arguments = req.params.arguments or {}
             
             # Find the requested tool
-            tool = next((t for t in self._tools if t.name == tool_name), None)
+            tool = self._tool_index.get(tool_name)
             if not tool:
-                return types.ServerResult(
-                    types.CallToolResult(
-                        content=[types.TextContent(type="text", text=f"Tool {tool_name} not found")],
-                        isError=True,
-                    ),
-                )
+                return _error_result(f"Tool {tool_name} not found")
             
-            # Check for required parameters
-            for param in tool.required_parameters:
-                if param not in arguments:
-                    return types.ServerResult(
-                        types.CallToolResult(
-                            content=[types.TextContent(
-                                type="text", 
-                                text=f"Missing required parameter: {param}"
-                            )],
-                            isError=True,
-                        ),
-                    )
+            # Check for required parameters, reporting the first missing one in declared order
+            if missing := tool.required_set - arguments.keys():
+                param = next(p for p in tool.required_parameters if p in missing)
+                return self._missing_parameter_results[param]
             
             # Handle specific tools
             try:
@@ -146,15 +157,7 @@ class SlackMCPServer(BaseMCPServer):
                         ),
                     )
                 else:
-                    return types.ServerResult(
-                        types.CallToolResult(
-                            content=[types.TextContent(
-                                type="text", 
-                                text=f"Tool {tool_name} is not implemented"
-                            )],
-                            isError=True,
-                        ),
-                    )
+                    return _error_result(f"Tool {tool_name} is not implemented")
             except Exception as e:  # noqa: BLE001
                 return types.ServerResult(
                     types.CallToolResult(
@@ -174,8 +177,27 @@ class SlackMCPServer(BaseMCPServer):
         Returns:
             Server information
         """
-        return self._server_info
+        return SLACK_SERVER_INFO
+
+
+_slack_server: t.Optional[SlackMCPServer] = None
+
+
+def get_slack_server() -> SlackMCPServer:
+    """Get the shared Slack MCP server, creating it on first use.
+
+    Returns:
+        The Slack MCP server instance
+    """
+    global _slack_server  # noqa: PLW0603
+    if _slack_server is None:
+        _slack_server = SlackMCPServer()
+    return _slack_server
 
 
-# Instantiate the server
-slack_server = SlackMCPServer() 
\ No newline at end of file
+def __getattr__(name: str) -> t.Any:  # noqa: ANN401
+    """Expose ``slack_server`` without instantiating it at import time."""
+    if name == "slack_server":
+        return get_slack_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+ 
\ No newline at end of file
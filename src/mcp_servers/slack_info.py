@@ -0,0 +1,14 @@
+"""Slack MCP server metadata.
+
+Kept apart from slack.py so the registry can list the server without importing
+its implementation.
+"""
+
+from .base import ServerInfo, ServerType
+
+SLACK_SERVER_INFO = ServerInfo(
+    name="slack",
+    description="Slack MCP server for interacting with Slack API",
+    server_type=ServerType.STDIO,
+    command="slack_mcp",
+)
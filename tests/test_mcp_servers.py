@@ -0,0 +1,140 @@
+"""Tests for the bundled local MCP servers and their registry."""
+
+import dataclasses
+import importlib
+import pickle
+import sys
+from collections.abc import Iterator
+
+import pytest
+from mcp import types
+
+import mcp_servers
+from mcp_servers import MCPServerRegistry, ServerInfo, ServerType
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> type[MCPServerRegistry]:
+    """Isolate registry state so tests can register servers freely."""
+    monkeypatch.setattr(MCPServerRegistry, "_servers", dict(MCPServerRegistry._servers))  # noqa: SLF001
+    monkeypatch.setattr(MCPServerRegistry, "_servers_cache", None)
+    monkeypatch.setattr(MCPServerRegistry, "_names_cache", None)
+    monkeypatch.setattr(MCPServerRegistry, "_sorted_cache", None)
+    monkeypatch.setattr(MCPServerRegistry, "_info_cache", {})
+    return MCPServerRegistry
+
+
+def test_registry_lists_bundled_servers() -> None:
+    """Bundled servers are registered as soon as the package is imported."""
+    server_info = MCPServerRegistry.get_server("slack")
+    assert server_info is not None
+    assert server_info.server_type is ServerType.STDIO
+    assert "slack" in [server.name for server in MCPServerRegistry.list_servers()]
+
+
+@pytest.fixture
+def fresh_import() -> Iterator[None]:
+    """Let a test import mcp_servers from scratch, restoring the loaded modules afterwards."""
+    saved = {name: module for name, module in sys.modules.items() if name.startswith("mcp_servers")}
+    for name in saved:
+        del sys.modules[name]
+    yield
+    for name in [name for name in sys.modules if name.startswith("mcp_servers")]:
+        del sys.modules[name]
+    sys.modules.update(saved)
+
+
+@pytest.mark.usefixtures("fresh_import")
+def test_package_import_does_not_load_backends() -> None:
+    """Importing the package registers servers without importing their implementations."""
+    package = importlib.import_module("mcp_servers")
+    assert package.MCPServerRegistry.get_server("slack") is not None
+    assert "mcp_servers.slack" not in sys.modules
+
+    slack_server = package.slack_server
+    slack = sys.modules["mcp_servers.slack"]
+    assert slack_server is slack.get_slack_server()
+    assert package.MCPServerRegistry.get_server("slack") is slack.SLACK_SERVER_INFO
+
+
+def test_lazy_attribute_access() -> None:
+    """Lazily exported servers are reachable through the package and listed by dir()."""
+    assert "slack_server" in dir(mcp_servers)
+    assert mcp_servers.slack_server is mcp_servers.slack_server
+    assert dir(mcp_servers).count("slack_server") == 1
+    assert mcp_servers.slack_server.server_info is MCPServerRegistry.get_server("slack")
+
+
+def test_registry_views_are_cached_until_register(registry: type[MCPServerRegistry]) -> None:
+    """Listings are reused between calls and refreshed when a server is registered."""
+    names = registry.list_server_names()
+    assert registry.list_server_names() is names
+    assert registry.describe_server("slack") is registry.describe_server("slack")
+    assert registry.describe_server("missing") is None
+
+    sorted_servers = registry.list_servers_sorted()
+    assert registry.list_servers_sorted() is sorted_servers
+
+    registry.register(ServerInfo("echo", "Echo server", ServerType.STDIO, "echo"))
+
+    assert registry.list_server_names() == (*names, "echo")
+    assert [server.name for server in registry.list_servers_sorted()] == sorted((*names, "echo"))
+    assert [server.name for server in registry.list_servers()][-1] == "echo"
+    assert registry.describe_server("echo") == {
+        "name": "echo",
+        "description": "Echo server",
+        "server_type": "STDIO",
+    }
+
+
+async def call_slack_tool(name: str, arguments: dict[str, str]) -> types.CallToolResult:
+    """Call a tool handler of the Slack server directly."""
+    app = await mcp_servers.slack_server.create_server()
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments=arguments),
+    )
+    result = await app.request_handlers[types.CallToolRequest](request)
+    return result.root
+
+
+async def test_slack_call_tool() -> None:
+    """Tools are dispatched by name."""
+    result = await call_slack_tool("SLACK_POST_MESSAGE", {"channel": "#general", "text": "hi"})
+    assert not result.isError
+    assert result.content[0].text == "Message sent to #general: hi"
+
+
+async def test_slack_call_tool_errors() -> None:
+    """Unknown tools and missing parameters are reported as tool errors."""
+    result = await call_slack_tool("SLACK_UNKNOWN", {})
+    assert result.isError
+    assert result.content[0].text == "Tool SLACK_UNKNOWN not found"
+    assert await call_slack_tool("SLACK_UNKNOWN", {}) is not result
+
+    result = await call_slack_tool("SLACK_POST_MESSAGE", {"text": "hi"})
+    assert result.isError
+    assert result.content[0].text == "Missing required parameter: channel"
+
+    again = await call_slack_tool("SLACK_POST_MESSAGE", {})
+    assert again is result
+
+
+async def test_slack_list_tools() -> None:
+    """The list tools response describes every tool with its input schema."""
+    app = await mcp_servers.slack_server.create_server()
+    result = await app.request_handlers[types.ListToolsRequest](None)
+    tools = {tool.name: tool for tool in result.root.tools}
+    assert set(tools) == {"SLACK_POST_MESSAGE", "SLACK_LIST_CHANNELS"}
+    assert tools["SLACK_POST_MESSAGE"].inputSchema["required"] == ["channel", "text"]
+    assert await app.request_handlers[types.ListToolsRequest](None) is result
+
+
+def test_server_info_defaults() -> None:
+    """Missing or explicit None args and env default to empty containers."""
+    assert ServerInfo("a", "", ServerType.STDIO, "a").args == []
+    server_info = ServerInfo("a", "", ServerType.STDIO, "a", args=None, env=None)
+    assert server_info.args == []
+    assert server_info.env == {}
+    assert dataclasses.asdict(server_info)["args"] == []
+    assert pickle.loads(pickle.dumps(server_info)) == server_info  # noqa: S301
@@ -0,0 +1,148 @@
+"""Tests for the server manager."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+
+import anyio
+import pytest
+
+from mcp_proxy import server_manager as server_manager_module
+from mcp_proxy.server_manager import ServerManager
+
+
+@pytest.fixture
+def spawned(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace the stdio transport with in-memory streams and record each spawn."""
+    commands: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def fake_stdio_client(params: object) -> AsyncGenerator[tuple[object, object], None]:
+        if params.command == "missing":
+            raise FileNotFoundError(params.command)
+        if params.command == "hanging":
+            try:
+                await asyncio.Event().wait()
+            finally:
+                commands.append("hanging-closed")
+        if params.command == "slow":
+            await asyncio.sleep(0.02)
+        commands.append(params.command)
+        send_stream, receive_stream = anyio.create_memory_object_stream(1)
+        async with send_stream, receive_stream, anyio.create_task_group() as tg:
+            if params.command == "crashing":
+                tg.start_soon(crash)
+            try:
+                yield receive_stream, send_stream
+            finally:
+                if params.command == "slow":
+                    commands.append("slow-closed")
+
+    async def crash() -> None:
+        await asyncio.sleep(0.01)
+        raise OSError("crashed")
+
+    monkeypatch.setattr(server_manager_module, "stdio_client", fake_stdio_client)
+    return commands
+
+
+async def test_stdio_connections_are_pooled(spawned: list[str]) -> None:
+    """Identical parameters reuse one server process, different ones spawn another."""
+    manager = ServerManager()
+
+    connect = manager.create_stdio_server_connection
+    sessions = await asyncio.gather(
+        *(connect("server", ["--flag"], {"A": "1"}) for _ in range(3)),
+    )
+    assert sessions[0] is not None
+    assert all(session is sessions[0] for session in sessions)
+    assert spawned == ["server"]
+
+    other = await manager.create_stdio_server_connection("server", ["--flag"], {"A": "2"})
+    assert other is not sessions[0]
+    assert spawned == ["server", "server"]
+
+    await manager.close_all()
+    assert not manager._stdio_locks  # noqa: SLF001
+    again = await manager.create_stdio_server_connection("server", ["--flag"], {"A": "1"})
+    assert again is not sessions[0]
+    assert len(spawned) == 3
+    await manager.close_all()
+
+
+async def test_stdio_connection_failure(spawned: list[str]) -> None:
+    """A server that fails to start is reported as None and not pooled."""
+    manager = ServerManager()
+    assert await manager.create_stdio_server_connection("missing") is None
+    assert not manager._stdio_pool  # noqa: SLF001
+    assert spawned == []
+
+
+async def test_stdio_connection_cancelled(spawned: list[str]) -> None:
+    """Cancelling a caller while the server starts shuts the server down."""
+    manager = ServerManager()
+    task = asyncio.create_task(manager.create_stdio_server_connection("hanging"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0.01)
+    assert spawned == ["hanging-closed"]
+    assert not manager._stdio_pool  # noqa: SLF001
+
+
+async def test_stdio_connection_dies(
+    spawned: list[str], caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A pooled server that dies is dropped from the pool and its error is logged."""
+    manager = ServerManager()
+    session = await manager.create_stdio_server_connection("crashing")
+    assert session is not None
+    await asyncio.sleep(0.05)
+    assert not manager._stdio_pool  # noqa: SLF001
+    assert "closed with an error: crashed" in caplog.text
+
+    assert await manager.create_stdio_server_connection("crashing") is not session
+    assert spawned == ["crashing", "crashing"]
+    await manager.close_all()
+
+
+async def test_close_all_waits_for_spawns_in_flight(spawned: list[str]) -> None:
+    """A server that is still starting when close_all() runs is closed as well."""
+    manager = ServerManager()
+    task = asyncio.create_task(manager.create_stdio_server_connection("slow"))
+    await asyncio.sleep(0.005)
+    await manager.close_all()
+    assert await task is not None
+    assert spawned == ["slow", "slow-closed"]
+    assert not manager._stdio_pool  # noqa: SLF001
+    assert not manager._stdio_locks  # noqa: SLF001
+
+
+async def test_remote_connection_failure() -> None:
+    """An unreachable remote server is reported as None."""
+    manager = ServerManager()
+    assert await manager.create_remote_server_connection("http://127.0.0.1:1/sse") is None
+
+
+async def test_remote_connections_are_forgotten(
+    spawned: list[str], monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Remote connections are dropped once they close, whether they fail or not."""
+    monkeypatch.setattr(
+        server_manager_module,
+        "sse_client",
+        lambda url, **_: server_manager_module.stdio_client(
+            server_manager_module.StdioServerParameters(command=url),
+        ),
+    )
+    manager = ServerManager()
+    assert await manager.create_remote_server_connection("crashing") is not None
+    assert await manager.create_remote_server_connection("server") is not None
+    await asyncio.sleep(0.05)
+    assert len(manager._remote_connections) == 1  # noqa: SLF001
+
+    await manager.close_all()
+    assert not manager._remote_connections  # noqa: SLF001
+    assert spawned == ["crashing", "server"]
+    await manager.close_all()